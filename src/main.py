@@ -1,7 +1,12 @@
 import sys
 import os
+import math
+import shutil
+import tempfile
+from itertools import islice
+from functools import lru_cache
 from PySide6.QtCore import QSize, Qt, QTimer
-from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QIcon
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QPainter, QPainterPath, QPen, QIcon, QImage, QTransform
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -23,64 +28,531 @@ from PySide6.QtWidgets import (
     QGridLayout
 )
 
-
-# Helper function: Convert text to path
-def text_to_path(text, font_family="Arial", font_size=50):
-    font = QFont(font_family, font_size)
+try:  # Optional: vectorized G-code generation
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: compiled kernels (requires NumPy), Numba is imported on the first G-code generation.
+# None: not loaded yet, afterwards True / False if the kernels are compiled or not
+_numba_loaded = None
+
+
+# Stylesheets of the dark / light theme
+_DARK_QSS = """
+    QMainWindow, QWidget {
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+    }
+    QGroupBox {
+        border: 1px solid #555555;
+        border-radius: 5px;
+        margin-top: 10px;
+        font-weight: bold;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QFontComboBox {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        padding: 2px 5px;
+    }
+    QPushButton, QToolButton {
+        background-color: #505050;
+        color: #e0e0e0;
+        border: 1px solid #666666;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QPushButton:hover, QToolButton:hover {
+        background-color: #606060;
+        border: 1px solid #7a7a7a;
+    }
+    QPushButton:pressed, QToolButton:pressed {
+        background-color: #404040;
+    }
+    QTextEdit {
+        font-family: "Courier";
+        background-color: #252525;
+        color: #e0e0e0;
+        border: 1px solid #555555;
+    }
+    QStatusBar {
+        background-color: #353535;
+        color: #e0e0e0;
+    }
+"""
+
+_LIGHT_QSS = """
+    QMainWindow, QWidget {
+        background-color: #f0f0f0;
+        color: #202020;
+    }
+    QGroupBox {
+        border: 1px solid #c0c0c0;
+        border-radius: 5px;
+        margin-top: 10px;
+        font-weight: bold;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QFontComboBox {
+        background-color: white;
+        color: #202020;
+        border: 1px solid #c0c0c0;
+        border-radius: 3px;
+        padding: 2px 5px;
+    }
+    QPushButton, QToolButton {
+        background-color: #e0e0e0;
+        color: #202020;
+        border: 1px solid #c0c0c0;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QPushButton:hover, QToolButton:hover {
+        background-color: #d0d0d0;
+        border: 1px solid #a0a0a0;
+    }
+    QPushButton:pressed, QToolButton:pressed {
+        background-color: #c0c0c0;
+    }
+    QTextEdit {
+        font-family: "Courier";
+        background-color: white;
+        color: #202020;
+        border: 1px solid #c0c0c0;
+    }
+    QStatusBar {
+        background-color: #e0e0e0;
+        color: #202020;
+    }
+"""
+
+
+# QFont objects by (family, size), avoids a font database lookup per text path
+_font_cache = {}
+
+
+# Helper function: Get the (shared) font, only read by QPainterPath.addText
+def _get_font(font_family, font_size):
+    key = (font_family, font_size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = QFont(font_family, font_size)
+        _font_cache[key] = font
+    return font
+
+
+# Helper function: Build the path of a text
+def _build_text_path(text, font_family, font_size):
+    font = _get_font(font_family, font_size)
     path = QPainterPath()
     path.addText(0, 0, font, text)
     return path
 
 
-# Helper function: Convert path to G-Code
-def path_to_gcode(path: QPainterPath, scale=0.1, safe_z=5.0, cut_z=0.0, feedrate=500,
-                 x_offset=0.0, y_offset=0.0, z_offset=0.0):
-    gcode = [
-        "G21 ; mm mode",
-        "G90 ; absolute positioning"
-    ]
+# Helper function: Convert text to path (cached, callers get a copy since QPainterPath is mutable).
+# Small cache: the live preview builds a path per typed prefix, only the latest ones are reused
+_cached_text_path = lru_cache(maxsize=16)(_build_text_path)
+
 
+def text_to_path(text, font_family="Arial", font_size=50):
+    return QPainterPath(_cached_text_path(text, font_family, font_size))
+
+
+# Helper function: Bounding box (width, height) of the text path in font units,
+# only the size is cached, the probe paths of the size search are discarded
+@lru_cache(maxsize=512)
+def _get_bounds(text, font_family, font_size):
+    bounds = _build_text_path(text, font_family, font_size).boundingRect()
+    return bounds.width(), bounds.height()
+
+
+# G-Code line templates (bytes %-formatting avoids per-line str objects)
+_GCODE_HEADER = b"G21 ; mm mode\nG90 ; absolute positioning\n"
+_GCODE_FOOTER = b"M2 ; Program end"
+_GCODE_RAPID_Z = b"G0 Z%.2f\n"
+_GCODE_RAPID_XY = b"G0 X%.2f Y%.2f\n"
+_GCODE_LINEAR_Z = b"G1 Z%.2f"
+_GCODE_LINEAR_XY = b"G1 X%.2f Y%.2f"
+_GCODE_ARC = b"G%d X%.2f Y%.2f I%.4f J%.4f"  # G2 clockwise / G3 counter-clockwise, I/J relative to start
+
+# Points closer than this (mm) can't be distinguished in the %.2f output
+_GCODE_PRECISION = 0.005
+
+# Larger radii are emitted as straight lines
+_MAX_ARC_RADIUS = 1000.0
+
+# Only the beginning of the G-code is shown, the complete program is in a temporary file
+_GCODE_PREVIEW_LINES = 1000
+
+
+# Helper function: Read all path elements into separate x / y / is-move lists
+# flatten: use the flattened curves (points on the outline) instead of the raw elements
+def _extract_elements(path: QPainterPath, flatten=False):
+    if flatten:
+        polygons = path.toSubpathPolygons()
+        xs = [point.x() for polygon in polygons for point in polygon]
+        ys = [point.y() for polygon in polygons for point in polygon]
+        moves = [j == 0 for polygon in polygons for j in range(len(polygon))]
+        return xs, ys, moves
+
+    # Bound method in a local, no attribute lookup per element
+    element_at = path.elementAt
+    elements = list(map(element_at, range(path.elementCount())))
+    xs = [elem.x for elem in elements]
+    ys = [elem.y for elem in elements]
+    moves = [elem.isMoveTo() for elem in elements]
+    return xs, ys, moves
+
+
+# Helper function: Scale / offset element coordinates into machine coordinates
+def _transform(xs, ys, scale, x_offset, y_offset):
+    out_x = xs * scale + x_offset
+    out_y = -ys * scale + y_offset  # Invert Y-axis for CNC
+    return out_x, out_y
+
+
+# Helper function: Mark LineTo/CurveTo points that don't change the drawn line (keep[i] = False)
+# - points closer than tol to the previously emitted point
+# - points on a straight line, every dropped point stays within tol of the emitted segment
+def _simplify(xs, ys, moves, keep, tol):
+    anchor = -1  # Last point that is emitted for sure
+    pending = -1  # Last emitted point, dropped again if the line continues straight
+    for i in range(len(xs)):
+        if moves[i] or anchor < 0:
+            anchor = i
+            pending = -1
+            continue
+
+        last = pending if pending >= 0 else anchor
+        if abs(xs[i] - xs[last]) < tol and abs(ys[i] - ys[last]) < tol:
+            keep[i] = False
+            continue
+
+        if pending >= 0:
+            dx = xs[i] - xs[anchor]
+            dy = ys[i] - ys[anchor]
+            length = math.hypot(dx, dy)
+            straight = length >= tol
+            for j in range(anchor + 1, i):
+                if not straight:
+                    break
+                px = xs[j] - xs[anchor]
+                py = ys[j] - ys[anchor]
+                along = px * dx + py * dy
+                straight = abs(px * dy - py * dx) <= tol * length and 0.0 <= along <= length * length
+            if straight:
+                keep[pending] = False  # Segment anchor -> i replaces anchor -> pending -> i
+            else:
+                anchor = pending
+        pending = i
+
+
+# Helper function: Circle through the points i..k as (fits, center x, center y, counter-clockwise),
+# fits is False if they aren't on a common arc within tol
+def _fit_arc(xs, ys, i, k, tol):
+    m = (i + k) // 2
+    ax, ay, bx, by, cx, cy = xs[i], ys[i], xs[m], ys[m], xs[k], ys[k]
+
+    # Start and end (already rounded to the output precision) must be distinct
+    if math.hypot(cx - ax, cy - ay) < _GCODE_PRECISION:
+        return False, 0.0, 0.0, False
+
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < 1e-12:
+        return False, 0.0, 0.0, False  # Collinear
+
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+
+    # The controller requires start and end on the same circle, so move the center onto
+    # the perpendicular bisector of the end points, the checks below use this final circle
+    mx, my = (ax + cx) / 2.0, (ay + cy) / 2.0
+    nx, ny = ay - cy, cx - ax
+    t = ((ux - mx) * nx + (uy - my) * ny) / (nx * nx + ny * ny)
+    ux, uy = mx + t * nx, my + t * ny
+    radius = math.hypot(ax - ux, ay - uy)
+    if radius > _MAX_ARC_RADIUS:
+        return False, 0.0, 0.0, False
+
+    # All points on the circle, all steps in the same direction and every chord close to the arc.
+    # Half the tolerance each, so the polyline points and chords together stay within tol
+    tol = tol / 2.0
+    ccw = d > 0
+    sweep = 0.0
+    for j in range(i, k):
+        x1, y1 = xs[j] - ux, ys[j] - uy
+        x2, y2 = xs[j + 1] - ux, ys[j + 1] - uy
+        step = math.atan2(x1 * y2 - y1 * x2, x1 * x2 + y1 * y2)
+        if (step > 0) != ccw or abs(math.hypot(x2, y2) - radius) > tol:
+            return False, 0.0, 0.0, False
+        if radius * (1.0 - math.cos(step / 2.0)) > tol:
+            return False, 0.0, 0.0, False
+        sweep += step
+    if abs(sweep) >= 1.9 * math.pi:
+        return False, 0.0, 0.0, False
+    return True, ux, uy, ccw
+
+
+# Helper function: Longest arc starting at point i and ending at or before end,
+# as (end index, center x, center y, counter-clockwise), end index -1 if no arc fits.
+# The arc end is searched with doubling steps and then bisected: O(n log n) point checks instead of O(n²)
+def _arc_end(xs, ys, i, end, tol):
+    best, best_x, best_y, best_ccw = -1, 0.0, 0.0, False
+    if end - i < 2:
+        return best, best_x, best_y, best_ccw
+
+    fits_to = i + 1  # Last end index known to fit (i + 1: none yet)
+    fails_at = end + 1  # First end index known not to fit
+    step = 2
+    while True:
+        k = min(i + step, end)
+        fits, ux, uy, ccw = _fit_arc(xs, ys, i, k, tol)
+        if not fits:
+            fails_at = k
+            break
+        best, best_x, best_y, best_ccw = k, ux, uy, ccw
+        fits_to = k
+        if k == end:
+            break
+        step *= 2
+
+    while fails_at - fits_to > 1:
+        k = (fits_to + fails_at) // 2
+        fits, ux, uy, ccw = _fit_arc(xs, ys, i, k, tol)
+        if fits:
+            best, best_x, best_y, best_ccw = k, ux, uy, ccw
+            fits_to = k
+        else:
+            fails_at = k
+    return best, best_x, best_y, best_ccw
+
+
+# Helper function: Replace the kernels above by compiled versions if Numba is available.
+# Done lazily, importing Numba slows down the start and the kernels are compiled on their first call
+def _load_numba():
+    global _numba_loaded, _transform, _simplify, _fit_arc, _arc_end
+    if _numba_loaded is not None:
+        return
+    _numba_loaded = False
+    if np is None:
+        return
+    try:
+        from numba import njit
+    except ImportError:
+        return
+
+    # On-disk cache avoids recompiling on every start, not possible inside a frozen (PyInstaller) build
+    jit = njit(cache=not getattr(sys, "frozen", False))
+    _transform = jit(_transform)
+    _simplify = jit(_simplify)
+    _fit_arc = jit(_fit_arc)  # Before _arc_end, which calls it
+    _arc_end = jit(_arc_end)
+    _numba_loaded = True
+
+
+# Helper function: Split the polyline start..end into arcs and lines,
+# yields (end index, arc or None), with arc as (center x, center y, counter-clockwise)
+def _fit_arcs(xs, ys, start, end, tol):
+    i = start
+    while i < end:
+        if tol is not None:
+            k, ux, uy, ccw = _arc_end(xs, ys, i, end, tol)
+            if k > 0:
+                yield k, (ux, uy, ccw)
+                i = k
+                continue
+        yield i + 1, None
+        i += 1
+
+
+# Helper function: G2/G3 move from (sx, sy) to (ex, ey) around the center (cx, cy)
+def _arc_to_gcode(sx, sy, ex, ey, arc, feed_suffix):
+    cx, cy, ccw = arc
+    return _GCODE_ARC % (3 if ccw else 2, ex, ey, cx - sx, cy - sy) + feed_suffix
+
+
+# Helper function: Generate the G-Code of a path in pieces (one per pen up / pen down run)
+def _iter_gcode(path, scale, safe_z, cut_z, feedrate, x_offset, y_offset, z_offset, arc_tolerance):
     if path.elementCount() == 0:
-        return "\n".join(gcode)
+        yield _GCODE_HEADER[:-1]
+        return
+
+    yield _GCODE_HEADER
+
+    # Precompute constant parts once
+    feed_suffix = f" F{feedrate}\n".encode("ascii")
+    pen_up = _GCODE_RAPID_Z % (safe_z + z_offset)
+    pen_down_line = _GCODE_LINEAR_Z % (cut_z + z_offset) + feed_suffix
+
+    xs, ys, moves = _extract_elements(path, flatten=arc_tolerance is not None)
+
+    if np is not None:
+        xs = np.array(xs, dtype=np.float64)
+        ys = np.array(ys, dtype=np.float64)
+        moves = np.array(moves, dtype=np.bool_)
+        xs, ys = _transform(xs, ys, float(scale), float(x_offset), float(y_offset))
+
+        if _numba_loaded:
+            keep = np.ones(len(xs), dtype=np.bool_)
+            _simplify(xs, ys, moves, keep, _GCODE_PRECISION)
+        else:  # Plain Python is faster on lists than on NumPy scalars
+            keep = [True] * len(xs)
+            _simplify(xs.tolist(), ys.tolist(), moves.tolist(), keep, _GCODE_PRECISION)
+            keep = np.array(keep, dtype=np.bool_)
+        xs, ys, moves = xs[keep], ys[keep], moves[keep]
+
+        if arc_tolerance is None:
+            # Split into runs of only MoveTo resp. only LineTo/CurveTo elements,
+            # the pen changes exactly at the run boundaries
+            bounds = [0, *(np.flatnonzero(np.diff(moves)) + 1).tolist(), len(moves)]
+            linear_xy = _GCODE_LINEAR_XY + feed_suffix
+            is_move_run = bool(moves[0])
+
+            # Interleaved x, y values, each run is formatted with a single %-operation in C
+            coords = np.column_stack((xs, ys)).ravel().tolist()
+
+            for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+                values = tuple(coords[2 * start:2 * end])
+                if is_move_run:
+                    if start > 0:
+                        yield pen_up  # Pen up
+                    yield (_GCODE_RAPID_XY * (end - start)) % values  # Position
+                else:
+                    yield pen_down_line  # Pen down
+                    yield (linear_xy * (end - start)) % values
+                is_move_run = not is_move_run
 
-    pen_down = False
+            if not moves[-1]:
+                yield pen_up  # Pen up at the end
 
-    for i in range(path.elementCount()):
-        elem = path.elementAt(i)
+            yield _GCODE_FOOTER
+            return
 
-        x = elem.x * scale + x_offset
-        y = -elem.y * scale + y_offset  # Invert Y-axis for CNC
+        xs, ys, moves = xs.tolist(), ys.tolist(), moves.tolist()
+    else:
+        xs = [x * scale + x_offset for x in xs]
+        ys = [-y * scale + y_offset for y in ys]  # Invert Y-axis for CNC
+        keep = [True] * len(xs)
+        _simplify(xs, ys, moves, keep, _GCODE_PRECISION)
+        xs = [x for x, kept in zip(xs, keep, strict=True) if kept]
+        ys = [y for y, kept in zip(ys, keep, strict=True) if kept]
+        moves = [is_move for is_move, kept in zip(moves, keep, strict=True) if kept]
+
+    fit_xs, fit_ys = xs, ys
+    if arc_tolerance is not None:
+        # Fit arcs to the coordinates as they are written, so the G-code stays within the tolerance
+        xs = [round(x, 2) for x in xs]
+        ys = [round(y, 2) for y in ys]
+        fit_xs, fit_ys = xs, ys
+        if _numba_loaded:  # The compiled arc fitter needs arrays, the emitter below is faster on lists
+            fit_xs, fit_ys = np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64)
+
+    buf = bytearray()
+    pen_down = False
+    linear_xy = _GCODE_LINEAR_XY + feed_suffix
+    n = len(xs)
+    i = 0
 
-        if elem.type == QPainterPath.ElementType.MoveToElement:
+    while i < n:
+        if moves[i]:
             if pen_down:
-                gcode.append(f"G0 Z{safe_z + z_offset:.2f}")  # Pen up
+                buf += pen_up  # Pen up
                 pen_down = False
-            gcode.append(f"G0 X{x:.2f} Y{y:.2f}")  # Position
-
-        else:  # LineTo or CurveTo
-            if not pen_down:
-                gcode.append(f"G1 Z{cut_z + z_offset:.2f} F{feedrate}")  # Pen down
-                pen_down = True
-            gcode.append(f"G1 X{x:.2f} Y{y:.2f} F{feedrate}")
+            buf += _GCODE_RAPID_XY % (xs[i], ys[i])  # Position
+            i += 1
+            continue
+
+        # LineTo or CurveTo, up to the next MoveTo (a path always starts with a MoveTo)
+        if not pen_down:
+            buf += pen_down_line  # Pen down
+            pen_down = True
+        end = i
+        while end < n and not moves[end]:
+            end += 1
+
+        last = i - 1
+        for k, arc in _fit_arcs(fit_xs, fit_ys, last, end - 1, arc_tolerance):
+            if arc is None:
+                buf += linear_xy % (xs[k], ys[k])
+            else:
+                buf += _arc_to_gcode(xs[last], ys[last], xs[k], ys[k], arc, feed_suffix)
+            last = k
+        i = end
+
+        yield buf
+        buf = bytearray()
 
     if pen_down:
-        gcode.append(f"G0 Z{safe_z + z_offset:.2f}")  # Pen up at the end
+        buf += pen_up  # Pen up at the end
+
+    buf += _GCODE_FOOTER
+    yield buf
+
 
-    gcode.append("M2 ; Program end")
-    return "\n".join(gcode)
+# Helper function: Convert path to G-Code
+# arc_tolerance: fit G2/G3 arcs (max. deviation in mm) to the flattened outline, None for G1 lines only
+# out: binary file to stream the G-Code into (returns None), otherwise the G-Code is returned as string
+def path_to_gcode(path: QPainterPath, scale=0.1, safe_z=5.0, cut_z=0.0, feedrate=500,
+                 x_offset=0.0, y_offset=0.0, z_offset=0.0, arc_tolerance=None, out=None):
+    _load_numba()
+    pieces = _iter_gcode(path, scale, safe_z, cut_z, feedrate, x_offset, y_offset, z_offset, arc_tolerance)
+    if out is None:
+        return b"".join(pieces).decode("ascii")
 
+    for piece in pieces:
+        out.write(piece)
 
 
 class PreviewWidget(QWidget):
+    # Curves are flattened once with the path scaled to this size (units ~ pixels),
+    # fine enough for any widget size
+    FLATTEN_SIZE = 2000.0
+
     def __init__(self):
         super().__init__()
         self.path = None
         self.line_width = 0.6  # Default 0.6 mm
         self.is_dark_mode = False
+        self._bounds = None  # Bounding rect of the path, cached per path
+        self._bounds_center = None
+        self._view_scale = None  # Cached per path and widget size
+        self._polys = []  # Flattened subpaths of the path
+        self._cache_img = None  # Rendered preview
+        self._cache_key = None  # Widget size and settings the image was rendered with, None if outdated
         self.setMinimumSize(QSize(300, 200))
 
     def set_path(self, path: QPainterPath):
         self.path = path
+        self._bounds = path.boundingRect()
+        self._bounds_center = self._bounds.center()
+        self._view_scale = None
+
+        # Flatten the curves once instead of on every paint
+        size = max(self._bounds.width(), self._bounds.height())
+        factor = self.FLATTEN_SIZE / size if size > 0 else 1.0
+        inverse = QTransform.fromScale(1 / factor, 1 / factor)
+        self._polys = [inverse.map(poly) for poly in path.toSubpathPolygons(QTransform.fromScale(factor, factor))]
+        self._cache_key = None
+        self.update()
+
+    def clear_path(self):
+        self.path = None
+        self._polys = []
+        self._cache_key = None
         self.update()
 
     def set_line_width(self, width):
@@ -91,10 +563,31 @@ class PreviewWidget(QWidget):
         self.is_dark_mode = is_dark
         self.update()
 
+    def resizeEvent(self, event):
+        self._view_scale = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         if not self.path:
             return
+
+        # Rasterize only if something visible changed, otherwise just blit the cached image
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio, self.is_dark_mode, self.line_width)
+        if key != self._cache_key:
+            self._cache_img = QImage(self.size() * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+            self._cache_img.setDevicePixelRatio(ratio)
+            image_painter = QPainter(self._cache_img)
+            try:
+                self._render(image_painter)
+            finally:
+                image_painter.end()  # The image must not be destroyed while it is painted on
+            self._cache_key = key
+
         painter = QPainter(self)
+        painter.drawImage(0, 0, self._cache_img)
+
+    def _render(self, painter):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Set background color based on theme
@@ -103,9 +596,13 @@ class PreviewWidget(QWidget):
         else:
             painter.fillRect(self.rect(), QColor(240, 240, 240))
 
-        # Calculate scaling and centering
-        bounds = self.path.boundingRect()
-        view_scale = min(self.width() / bounds.width(), self.height() / bounds.height()) * 0.9
+        # Calculate scaling and centering, nothing to draw for a path without extent (e.g. zero-width space)
+        bounds = self._bounds
+        if bounds.width() <= 0 or bounds.height() <= 0:
+            return
+        if self._view_scale is None:
+            self._view_scale = min(self.width() / bounds.width(), self.height() / bounds.height()) * 0.9
+        view_scale = self._view_scale
 
         # G-Code scale factor (from path_to_gcode)
         gcode_scale = 0.1
@@ -113,7 +610,7 @@ class PreviewWidget(QWidget):
         # Apply transformations for centering and scaling
         painter.translate(self.width() / 2, self.height() / 2)
         painter.scale(view_scale, view_scale)
-        painter.translate(-bounds.center().x(), -bounds.center().y())
+        painter.translate(-self._bounds_center.x(), -self._bounds_center.y())
 
         # Set pen AFTER transformations
         # QPainter applies transformations to geometry but not to pen width
@@ -124,8 +621,12 @@ class PreviewWidget(QWidget):
         pen.setWidthF(scaled_width)
         painter.setPen(pen)
 
-        # Draw path
-        painter.drawPath(self.path)
+        # Draw the flattened path (closed outlines as polygon to get a line join at the start point)
+        for poly in self._polys:
+            if poly.isClosed():
+                painter.drawPolygon(poly)
+            else:
+                painter.drawPolyline(poly)
 
 
 class GCodeApp(QMainWindow):
@@ -142,6 +643,16 @@ class GCodeApp(QMainWindow):
 
         # Set initial theme
         self.is_dark_mode = False
+        self._current_qss = None  # Stylesheet currently applied
+
+        # Timer to coalesce rapid edits into a single preview update (~60 Hz)
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._do_repaint)
+        self._preview_key = None  # (text, font family, font size) of the preview path
+
+        # Temporary file with the last generated G-code
+        self._gcode_file = None
 
         # Create status bar for messages
         self.status_bar = QStatusBar()
@@ -156,6 +667,7 @@ class GCodeApp(QMainWindow):
         font_label = QLabel("Font:")
         self.font_combo = QFontComboBox()
         self.font_combo.setCurrentFont(QFont("Arial"))
+        self.font_combo.currentFontChanged.connect(self.schedule_preview_update)
         font_layout.addWidget(font_label)
         font_layout.addWidget(self.font_combo, 1)
         input_layout.addLayout(font_layout)
@@ -164,6 +676,7 @@ class GCodeApp(QMainWindow):
         text_label = QLabel("Enter Text:")
         self.text_input = QLineEdit()
         self.text_input.setPlaceholderText("Type your text here...")
+        self.text_input.textChanged.connect(self.schedule_preview_update)
         input_layout.addWidget(text_label)
         input_layout.addWidget(self.text_input)
 
@@ -219,6 +732,7 @@ class GCodeApp(QMainWindow):
         self.size_spin = QSpinBox()
         self.size_spin.setRange(10, 500)
         self.size_spin.setValue(100)
+        self.size_spin.valueChanged.connect(self.schedule_preview_update)
         size_layout_h.addWidget(size_label)
         size_layout_h.addWidget(self.size_spin)
         size_layout_h.addStretch(1)
@@ -265,10 +779,13 @@ class GCodeApp(QMainWindow):
         self.line_width_spin.setRange(0.1, 5.0)
         self.line_width_spin.setValue(0.6)
         self.line_width_spin.setSingleStep(0.1)
-        self.line_width_spin.valueChanged.connect(self.update_line_width)
+        self.line_width_spin.valueChanged.connect(self.schedule_preview_update)
         line_width_layout.addWidget(line_width_label)
         line_width_layout.addWidget(self.line_width_spin)
         line_width_layout.addStretch(1)
+        self.arc_check = QCheckBox("Fit arcs (G2/G3)")
+        self.arc_check.setChecked(False)  # Not every controller supports G2/G3
+        line_width_layout.addWidget(self.arc_check)
         size_layout.addLayout(line_width_layout)
 
         size_group.setLayout(size_layout)
@@ -310,6 +827,7 @@ class GCodeApp(QMainWindow):
         self.gcode_preview = QTextEdit()
         self.gcode_preview.setFont(QFont("Courier", 10))
         self.gcode_preview.setReadOnly(True)
+        self.gcode_preview.setUndoRedoEnabled(False)
         gcode_layout.addWidget(gcode_label)
         gcode_layout.addWidget(self.gcode_preview, 1)
 
@@ -336,9 +854,24 @@ class GCodeApp(QMainWindow):
         # Apply initial theme
         self.apply_theme()
 
-    def update_line_width(self):
+    def schedule_preview_update(self):
+        # Restart the timer, so a burst of edits results in one preview update
+        self._repaint_timer.start(16)
+
+    def _do_repaint(self):
         self.preview.set_line_width(self.line_width_spin.value())
 
+        # Live preview of the current text, G-code is only built on demand.
+        # The path is only rebuilt if text, font or size changed, not for line width edits
+        text = self.text_input.text()
+        key = (text, self.font_combo.currentFont().family(), self.size_spin.value())
+        if not text.strip():
+            self._preview_key = None
+            self.preview.clear_path()
+        elif key != self._preview_key:
+            self._preview_key = key
+            self.preview.set_path(text_to_path(text, font_family=key[1], font_size=key[2]))
+
     def generate_gcode(self):
         text = self.text_input.text()
         if not text.strip():
@@ -357,37 +890,58 @@ class GCodeApp(QMainWindow):
         # Get feedrate value
         feedrate = self.feedrate_spin.value()
 
+        # Arc tolerance, a quarter of the line width is not visible in the drawing
+        arc_tolerance = self.line_width_spin.value() / 4 if self.arc_check.isChecked() else None
+
         # Check if max. dimensions are enabled
         if self.max_dim_check.isChecked():
             max_width_mm = self.max_width_spin.value()
             max_height_mm = self.max_height_spin.value()
 
-            # Binary search for optimal font size
             min_size = 1
             max_size = 500
             optimal_size = font_size
 
-            while min_size <= max_size:
-                mid_size = (min_size + max_size) // 2
-                test_path = text_to_path(text, font_family=font_family, font_size=mid_size)
-                bounds = test_path.boundingRect()
-
-                width_mm = bounds.width() * scale
-                height_mm = bounds.height() * scale
-
-                if width_mm <= max_width_mm and height_mm <= max_height_mm:
-                    # This size fits, try going larger
-                    optimal_size = mid_size
-                    min_size = mid_size + 1
-                else:
-                    # This size is too big, try going smaller
-                    max_size = mid_size - 1
+            def fits(size):
+                width, height = _get_bounds(text, font_family, size)
+                return width * scale <= max_width_mm and height * scale <= max_height_mm
+
+            # Estimate from a single probe, font metrics scale almost linearly with the point size
+            probe_size = 100
+            probe_width, probe_height = _get_bounds(text, font_family, probe_size)
+            w_ratio = probe_width * scale / probe_size
+            h_ratio = probe_height * scale / probe_size
+
+            if QFontDatabase.isSmoothlyScalable(font_family) and w_ratio > 0 and h_ratio > 0:
+                estimate = int(min(max_width_mm / w_ratio, max_height_mm / h_ratio))
+                estimate = max(min_size, min(max_size, estimate))
+
+                # Correct rounding / hinting deviations by single steps
+                while estimate < max_size and fits(estimate + 1):
+                    estimate += 1
+                while estimate > min_size and not fits(estimate):
+                    estimate -= 1
+                if fits(estimate):
+                    optimal_size = estimate
+            else:
+                # Binary search for optimal font size (bitmap fonts don't scale linearly)
+                while min_size <= max_size:
+                    mid_size = (min_size + max_size) // 2
+
+                    if fits(mid_size):
+                        # This size fits, try going larger
+                        optimal_size = mid_size
+                        min_size = mid_size + 1
+                    else:
+                        # This size is too big, try going smaller
+                        max_size = mid_size - 1
 
             # Use the optimal size
             font_size = optimal_size
             self.size_spin.setValue(font_size)  # Update UI
 
         path = text_to_path(text, font_family=font_family, font_size=font_size)
+        self._preview_key = (text, font_family, font_size)  # The size change above needs no second rebuild
         self.preview.set_path(path)
 
         # Calculate dimensions
@@ -396,22 +950,52 @@ class GCodeApp(QMainWindow):
         height_mm = bounds.height() * scale
         self.dimensions_label.setText(f"Dimensions: {width_mm:.2f} x {height_mm:.2f} mm")
 
-        gcode = path_to_gcode(path, scale=scale,
-                              x_offset=x_offset, y_offset=y_offset, z_offset=z_offset, feedrate=feedrate)
-        self.gcode_preview.setPlainText(gcode)
+        # Stream the G-code to a temporary file, the program isn't kept in memory.
+        # The file replaces the last G-code only once it is complete
+        gcode_file = tempfile.NamedTemporaryFile("w+b", suffix=".g", delete=False, buffering=1 << 20)
+        try:
+            path_to_gcode(path, scale=scale,
+                          x_offset=x_offset, y_offset=y_offset, z_offset=z_offset, feedrate=feedrate,
+                          arc_tolerance=arc_tolerance, out=gcode_file)
+            gcode_file.flush()
+        except Exception:
+            gcode_file.close()
+            os.remove(gcode_file.name)
+            raise
+        self._discard_gcode_file()
+        self._gcode_file = gcode_file
+
+        # Show the first lines only
+        self._gcode_file.seek(0)
+        head = b"".join(islice(self._gcode_file, _GCODE_PREVIEW_LINES)).decode("ascii")
+        if self._gcode_file.read(1):
+            head += "..."
+        self.gcode_preview.setPlainText(head)
 
         self.status_bar.showMessage("G-code generated successfully", 3000)
 
+    def _discard_gcode_file(self):
+        if self._gcode_file is None:
+            return
+        self._gcode_file.close()
+        try:
+            os.remove(self._gcode_file.name)
+        except OSError:
+            pass
+        self._gcode_file = None
+
     def copy_gcode(self):
-        gcode = self.gcode_preview.toPlainText()
+        if self._gcode_file is None:
+            return
+        self._gcode_file.seek(0)
+        gcode = self._gcode_file.read().decode("ascii")
         if gcode:
             clipboard = QApplication.clipboard()
             clipboard.setText(gcode)
             self.status_bar.showMessage("G-code copied to clipboard", 3000)
 
     def save_gcode(self):
-        gcode = self.gcode_preview.toPlainText()
-        if not gcode:
+        if self._gcode_file is None:
             self.status_bar.showMessage("No G-code to save", 3000)
             return
 
@@ -429,12 +1013,15 @@ class GCodeApp(QMainWindow):
 
         if filename:
             try:
-                with open(filename, 'w') as file:
-                    file.write(gcode)
+                shutil.copyfile(self._gcode_file.name, filename)
                 self.status_bar.showMessage(f"G-code saved as {filename}", 3000)
             except Exception as e:
                 self.status_bar.showMessage(f"Error saving: {e}", 5000)
 
+    def closeEvent(self, event):
+        self._discard_gcode_file()
+        super().closeEvent(event)
+
     def toggle_theme(self):
         self.is_dark_mode = not self.is_dark_mode
         self.theme_button.setText("☀️" if self.is_dark_mode else "🌙")
@@ -442,110 +1029,12 @@ class GCodeApp(QMainWindow):
         self.preview.set_theme(self.is_dark_mode)
 
     def apply_theme(self):
-        if self.is_dark_mode:
-            # Dark theme
-            stylesheet = """
-            QMainWindow, QWidget {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-            QGroupBox {
-                border: 1px solid #555555;
-                border-radius: 5px;
-                margin-top: 10px;
-                font-weight: bold;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QFontComboBox {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                padding: 2px 5px;
-            }
-            QPushButton, QToolButton {
-                background-color: #505050;
-                color: #e0e0e0;
-                border: 1px solid #666666;
-                border-radius: 4px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover, QToolButton:hover {
-                background-color: #606060;
-                border: 1px solid #7a7a7a;
-            }
-            QPushButton:pressed, QToolButton:pressed {
-                background-color: #404040;
-            }
-            QTextEdit {
-                font-family: "Courier";
-                background-color: #252525;
-                color: #e0e0e0;
-                border: 1px solid #555555;
-            }
-            QStatusBar {
-                background-color: #353535;
-                color: #e0e0e0;
-            }
-            """
-        else:
-            # Light theme
-            stylesheet = """
-            QMainWindow, QWidget {
-                background-color: #f0f0f0;
-                color: #202020;
-            }
-            QGroupBox {
-                border: 1px solid #c0c0c0;
-                border-radius: 5px;
-                margin-top: 10px;
-                font-weight: bold;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QFontComboBox {
-                background-color: white;
-                color: #202020;
-                border: 1px solid #c0c0c0;
-                border-radius: 3px;
-                padding: 2px 5px;
-            }
-            QPushButton, QToolButton {
-                background-color: #e0e0e0;
-                color: #202020;
-                border: 1px solid #c0c0c0;
-                border-radius: 4px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover, QToolButton:hover {
-                background-color: #d0d0d0;
-                border: 1px solid #a0a0a0;
-            }
-            QPushButton:pressed, QToolButton:pressed {
-                background-color: #c0c0c0;
-            }
-            QTextEdit {
-                font-family: "Courier";
-                background-color: white;
-                color: #202020;
-                border: 1px solid #c0c0c0;
-            }
-            QStatusBar {
-                background-color: #e0e0e0;
-                color: #202020;
-            }
-            """
+        stylesheet = _DARK_QSS if self.is_dark_mode else _LIGHT_QSS
+        if stylesheet is self._current_qss:
+            return  # Avoid a re-polish of all widgets
 
         # Set the stylesheet
+        self._current_qss = stylesheet
         self.setStyleSheet(stylesheet)
 
 